@@ -4,23 +4,146 @@ import pygame
 import sys
 import time
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import soundfile as sf
+from scipy.fft import rfft, rfftfreq
 from mutagen.flac import FLAC
 
+# numba 为可选依赖：安装后Goertzel解码会被编译为多线程并行的机器码
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 # ====== 默认参数配置（编码阶段使用） ======
 F_MIN = 500                         # 音频频率最小值（对应图像黑色）
 F_MAX = 3000                        # 音频频率最大值（对应图像白色）
 SAMPLE_RATE = 44100                 # 音频采样率
 SAMPLES_PER_PIXEL = 48             # 每个像素点对应的音频采样点数（决定音频时长和分辨率）
+ENCODE_BLOCK_PIXELS = 1024          # 编码时每批生成并写入文件的像素数（使每批数据能留在CPU缓存中）
 
 # ====== 解码与显示参数配置 ======
 SCREEN_W = 1280                     # 显示窗口宽度（像素）
 SCREEN_H = 720                      # 显示窗口高度（像素）
 N_FFT = 512                         # 快速傅里叶变换的点数（影响频率解析精度）
+DETECT_METHOD = "goertzel"          # 频率检测方式："goertzel"（窄带滤波器组）或 "fft"（快速傅里叶变换）
+GOERTZEL_TONES = 32                 # Goertzel检测的候选频率个数（即可区分的灰度级数）
+DECODE_CHUNK_PIXELS = 16384         # 解码时每块检测的像素数（块与块之间处理窗口事件，并限制中间数组的内存占用）
 VOLUME_PERCENT = 5                  # 播放音频时的音量（百分比，避免音量过大）
 # =====================
 
 
+def _abs2(z):
+    # 复数数组的模的平方：re² + im²（比 np.abs 少一次开方）
+    return z.real * z.real + z.imag * z.imag
+
+
+def _goertzel_peaks(frames, window, coeffs):
+    # 纯NumPy实现的Goertzel检测：返回每个像素能量最强的候选频率序号
+    num_pixels, samples_per_pixel = frames.shape
+    n_tones = coeffs.shape[0]
+
+    # 加窗后转置为 [采样点, 像素]，使每一步递推读取连续内存
+    frames_win = (frames * window).T.copy()
+
+    # 递推状态缓冲区只分配一次，循环内通过 out 参数原地计算并轮换使用
+    s0 = np.empty((num_pixels, n_tones), dtype=np.float32)
+    s1 = np.zeros((num_pixels, n_tones), dtype=np.float32)
+    s2 = np.zeros((num_pixels, n_tones), dtype=np.float32)
+
+    # 对所有像素、所有候选频率同时执行Goertzel递推（循环次数只等于每像素采样点数）
+    for n in range(samples_per_pixel):
+        # s0 = coeffs * s1 - s2 + x[n]
+        np.multiply(coeffs, s1, out=s0)
+        np.subtract(s0, s2, out=s0)
+        np.add(s0, frames_win[n][:, None], out=s0)
+        s2, s1, s0 = s1, s0, s2
+
+    # 计算每个候选频率上的能量（无需开方，不影响比较大小）
+    power = s1 * s1 + s2 * s2 - coeffs * s1 * s2
+
+    # 能量最强的候选频率即编码时的原始频率
+    return np.argmax(power, axis=1)
+
+
+def _fft_peaks(frames, window, n_fft, f_min_idx, f_max_idx):
+    # 批量FFT检测：返回每个像素在有效频率范围内幅值最大的频点序号（相对于有效范围的起点）
+
+    # 对所有像素加窗后的音频段一次性批量进行快速傅里叶变换（时域转频域），
+    # 由 n=n_fft 在内部补零到n_fft长度（提高FFT的频率分辨率）
+    spectrum = rfft(frames * window, n=n_fft, axis=1)
+
+    # 计算频域信号的能量（幅值的平方，省去开方，不影响比较大小）
+    magnitude = _abs2(spectrum[:, f_min_idx:f_max_idx + 1])
+
+    # 幅值最大的频率即编码时的原始频率
+    return np.argmax(magnitude, axis=1)
+
+
+def _detect_in_chunks(detect, frames, parallel=True):
+    # 将像素按 DECODE_CHUNK_PIXELS 分块检测，并按顺序逐块产出 (起始像素序号, 检测结果)，
+    # 调用方可以在块与块之间处理窗口事件；每块的大小同时限制了FFT频谱等中间数组的内存占用
+    starts = range(0, frames.shape[0], DECODE_CHUNK_PIXELS)
+    chunks = (frames[start:start + DECODE_CHUNK_PIXELS] for start in starts)
+
+    if not parallel:
+        yield from zip(starts, map(detect, chunks))
+        return
+
+    # 各块交给线程池并行检测（NumPy/SciPy的计算会释放GIL）
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    try:
+        yield from zip(starts, executor.map(detect, chunks))
+    finally:
+        # 提前结束（如关闭窗口）时取消尚未开始的块
+        executor.shutdown(cancel_futures=True)
+
+
+if njit is not None:
+    # Numba内核中每个并行任务处理的像素数（递推状态缓冲区每块分配一次）
+    _KERNEL_BLOCK_PIXELS = 256
+
+    @lru_cache(maxsize=None)
+    def _make_goertzel_kernel(samples_per_pixel, n_tones):
+        # 每像素采样点数和候选频率个数作为编译期常量闭包进内核，
+        # 使LLVM可以展开采样点循环、并对候选频率循环做SIMD向量化
+        @njit(parallel=True, cache=True, fastmath=True, boundscheck=False)
+        def kernel(frames, window, coeffs, out):
+            num_pixels = frames.shape[0]
+            # 按像素块并行：递推状态缓冲区每块只分配一次，块内逐像素清零复用，
+            # 避免在最内层的像素循环中分配数组
+            for block in prange((num_pixels + _KERNEL_BLOCK_PIXELS - 1) // _KERNEL_BLOCK_PIXELS):
+                s1 = np.empty(n_tones, dtype=np.float32)
+                s2 = np.empty(n_tones, dtype=np.float32)
+                start = block * _KERNEL_BLOCK_PIXELS
+                for i in range(start, min(start + _KERNEL_BLOCK_PIXELS, num_pixels)):
+                    s1[:] = 0.0
+                    s2[:] = 0.0
+                    # 每个像素的加窗采样点只计算一次，同时推进所有候选频率的Goertzel递推
+                    for n in range(samples_per_pixel):
+                        x = frames[i, n] * window[n]
+                        for k in range(n_tones):
+                            s0 = coeffs[k] * s1[k] - s2[k] + x
+                            s2[k] = s1[k]
+                            s1[k] = s0
+
+                    # 能量最强的候选频率即编码时的原始频率
+                    best_k = 0
+                    best_power = np.float32(-1.0)
+                    for k in range(n_tones):
+                        power = s1[k] * s1[k] + s2[k] * s2[k] - coeffs[k] * s1[k] * s2[k]
+                        if power > best_power:
+                            best_power = power
+                            best_k = k
+                    out[i] = best_k
+
+        return kernel
+else:
+    _make_goertzel_kernel = None
+
+
 def image_to_audio(image_path, output_flac):
 
     print(f"🖼️ 加载图像: {image_path}")
@@ -28,36 +151,40 @@ def image_to_audio(image_path, output_flac):
     # 打开图像并转换为灰度模式（L模式：0=黑，255=白）
     img = Image.open(image_path).convert('L')
     width, height = img.size         # 获取图像的宽和高
-    # 将像素值转换为0-1之间的浮点数
-    pixels = np.array(img) / 255.0
+    # 读取每个像素的灰度级（0-255的整数）
+    pixels = np.asarray(img, dtype=np.uint8)
     data = pixels.T
 
     # 计算音频总采样点数：总像素数 × 每个像素对应的采样点数
     total_samples = data.size * SAMPLES_PER_PIXEL
-    # 创建空的音频数组（float32格式，符合音频标准）
-    audio = np.zeros(total_samples, dtype=np.float32)
     # 生成时间基轴：对应每个像素的采样点的时间坐标（单位：秒）
-    t_base = np.arange(SAMPLES_PER_PIXEL) / SAMPLE_RATE
-
-    idx = 0  # 音频数组的写入位置指针
-    # 遍历每一列像素
-    for column in data:
-        # 遍历列中的每个像素
-        for pixel in column:
-            # 将像素灰度值（0-1）映射到F_MIN到F_MAX的频率
-            freq = F_MIN + pixel * (F_MAX - F_MIN)
-            # 生成对应频率的正弦波（音频信号）
-            wave = np.sin(2 * np.pi * freq * t_base)
-            # 将生成的正弦波写入音频数组的对应位置
-            audio[idx:idx + SAMPLES_PER_PIXEL] = wave
-            # 移动指针到下一个像素的位置
-            idx += SAMPLES_PER_PIXEL
-
-    # 音频信号限幅：确保所有值在[-1, 1]范围内（避免音频失真）
-    audio = np.clip(audio, -1, 1)
-
-    # 将音频数据写入FLAC文件（无损压缩格式，保留完整音频信息）
-    sf.write(output_flac, audio, SAMPLE_RATE, format="FLAC")
+    t_base = (np.arange(SAMPLES_PER_PIXEL) / SAMPLE_RATE).astype(np.float32)
+
+    # 灰度图只有256个灰度级，因此只可能出现256种正弦波：
+    # 将每个灰度级（0-1）映射到F_MIN到F_MAX的频率，并预先生成对应的正弦波查找表
+    levels = np.arange(256, dtype=np.float32) * (1.0 / 255.0)
+    level_freqs = F_MIN + levels * (F_MAX - F_MIN)
+    wave_lut = np.sin((2 * np.pi * level_freqs)[:, None] * t_base[None, :], dtype=np.float32)
+
+    # 按列优先顺序展开全部像素
+    pixels_flat = data.reshape(-1)
+
+    # 每块音频的缓冲区（float32格式，符合音频标准）只分配一次，视为 [像素, 采样点] 的二维数组
+    block_buffer = np.empty((ENCODE_BLOCK_PIXELS, SAMPLES_PER_PIXEL), dtype=np.float32)
+
+    # 以流式方式写入FLAC文件（无损压缩格式，保留完整音频信息）：
+    # 按固定像素数分块生成音频并立即写入，无需在内存中保存完整音频
+    with sf.SoundFile(output_flac, 'w', SAMPLE_RATE, 1, format="FLAC") as flac_out:
+        for b in range(0, data.size, ENCODE_BLOCK_PIXELS):
+            block_pixels = pixels_flat[b:b + ENCODE_BLOCK_PIXELS]
+            block = block_buffer[:block_pixels.size]
+            # 以灰度级为索引查表，取出每个像素对应的正弦波（无需对每个像素计算 np.sin，
+            # 且每块约 ENCODE_BLOCK_PIXELS × SAMPLES_PER_PIXEL × 4 字节，可留在CPU缓存中）
+            # （uint8灰度级不会超出256行的查找表，mode='clip' 使结果直接写入 out 而不经过额外缓冲）
+            np.take(wave_lut, block_pixels, axis=0, out=block, mode='clip')
+            # 音频信号限幅：确保所有值在[-1, 1]范围内（避免音频失真）
+            np.clip(block, -1, 1, out=block)
+            flac_out.write(block.reshape(-1))
 
     # 构建元数据字典：保存解码所需的关键参数
     metadata = {
@@ -76,7 +203,7 @@ def image_to_audio(image_path, output_flac):
     flac_file.save()
 
     # 计算并输出音频时长
-    duration = len(audio) / SAMPLE_RATE
+    duration = total_samples / SAMPLE_RATE
     print("✅ 编码完成")
     print(f"   分辨率: {width}x{height}")
     print(f"   音频时长: {duration:.2f} 秒")
@@ -105,8 +232,9 @@ def decode_play_draw(input_flac, output_image_path):
     SAMPLE_RATE = metadata["SAMPLE_RATE"]
     N_FFT = metadata["N_FFT"]
 
-    # 读取音频数据（忽略返回的采样率，使用元数据中的采样率保证一致性）
-    audio, _ = sf.read(input_flac)
+    # 读取音频数据（忽略返回的采样率，使用元数据中的采样率保证一致性），
+    # 直接读取为float32，后续计算全部使用单精度以减少内存占用
+    audio, _ = sf.read(input_flac, dtype='float32')
 
     # 如果是立体声（二维数组），只取左声道（第一列）转为单声道
     if audio.ndim > 1:
@@ -123,131 +251,162 @@ def decode_play_draw(input_flac, output_image_path):
     # 截取刚好能还原完整图像的音频段
     audio = audio[:expected_samples]
 
+    # 混音器参数需在 pygame.init() 之前设置（pygame.init() 会以默认参数打开混音器）；
+    # 只允许SDL改变声道数，采样率必须保持为SAMPLE_RATE，否则直接生成的声音会变快/变慢
+    pygame.mixer.pre_init(
+        SAMPLE_RATE, -16, 1, 1024,
+        allowedchanges=pygame.AUDIO_ALLOW_CHANNELS_CHANGE
+    )
     pygame.init()
-    pygame.mixer.init(SAMPLE_RATE, -16, 1, 1024)
     screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
     
     window_title = f"🌌 藏在声音里的图片 | 图片分辨率：{width}x{height}"
     pygame.display.set_caption(window_title)
 
-    # 加载音频文件并准备播放
-    sound = pygame.mixer.Sound(input_flac)
+    # 混音器实际打开的采样率和声道数可能与请求的不同
+    mixer_rate, _, channels = pygame.mixer.get_init()
+    if mixer_rate == SAMPLE_RATE:
+        # 直接用已读取的音频数据生成声音（转换为16位整数，无需重新读取并解码FLAC文件）
+        samples = (audio * 32767).astype(np.int16)
+        # 声道数多于1时，把单声道复制到每个声道
+        if channels > 1:
+            samples = np.repeat(samples[:, None], channels, axis=1)
+        sound = pygame.sndarray.make_sound(samples)
+    else:
+        # 采样率不同（如混音器在别处已被初始化）：由pygame读取FLAC文件并重采样，保证播放速度正确
+        sound = pygame.mixer.Sound(input_flac)
     # 设置播放音量（转换为0-1的浮点数）
     sound.set_volume(VOLUME_PERCENT / 100.0)
     sound.play()
 
-    # 生成像素坐标列表：按列优先的顺序（和编码时的处理顺序一致）
-    coords = [(x, y) for x in range(width) for y in range(height)]
-
-    # 创建空数组存储还原后的像素值（0-1）
-    recovered_pixels = np.zeros(num_pixels, dtype=np.float32)
-
-    # 计算FFT对应的频率轴（获取每个FFT点对应的实际频率）
-    freqs = np.fft.rfftfreq(N_FFT, d=1.0 / SAMPLE_RATE)
-    # 筛选出在目标频率范围内的索引（±100Hz容错，避免频率偏移）
-    valid_idx = np.where((freqs >= F_MIN - 100) & (freqs <= F_MAX + 100))[0]
-
-    # 检查是否有有效的频率索引
-    if len(valid_idx) == 0:
-        print("❌ 频率范围错误")
-        return
-
-    # 获取有效频率范围的起止索引
-    f_min_idx, f_max_idx = valid_idx[0], valid_idx[-1]
-
-    # 创建一个和原始图像大小一致的pygame表面（用于绘制还原的像素）
-    image_surface = pygame.Surface((width, height))
-
-    # 逐个像素还原图像
-    for i in range(num_pixels):
+    # 按像素切分音频：每行对应一个像素的音频段（列优先顺序，和编码时一致）
+    frames = audio.reshape(num_pixels, SAMPLES_PER_PIXEL)
+
+    # 汉宁窗只需计算一次（减少频谱泄漏，提高频率检测精度）
+    window = np.hanning(SAMPLES_PER_PIXEL).astype(np.float32)
+
+    if DETECT_METHOD == "goertzel":
+        # 候选频率：在F_MIN到F_MAX之间均匀取GOERTZEL_TONES个音调（对应等间隔的灰度级）
+        tones = np.linspace(F_MIN, F_MAX, GOERTZEL_TONES)
+        # Goertzel滤波器系数：每个候选频率一个
+        coeffs = (2 * np.cos(2 * np.pi * tones / SAMPLE_RATE)).astype(np.float32)
+        # 灰度查找表：候选频率的序号直接对应等间隔的灰度级
+        gray_lut = np.linspace(0.0, 1.0, GOERTZEL_TONES, dtype=np.float32)
+
+        if _make_goertzel_kernel is not None:
+            # 已安装numba：使用针对当前参数编译的内核检测，内核本身已通过prange并行，
+            # 因此直接在主线程中逐块调用
+            kernel = _make_goertzel_kernel(SAMPLES_PER_PIXEL, GOERTZEL_TONES)
+
+            def detect(chunk):
+                chunk_peaks = np.empty(chunk.shape[0], dtype=np.int64)
+                kernel(chunk, window, coeffs, chunk_peaks)
+                return chunk_peaks
+
+            parallel = False
+        else:
+            # 未安装numba：以NumPy实现检测，各块由线程池并行处理
+            def detect(chunk):
+                return _goertzel_peaks(chunk, window, coeffs)
+
+            parallel = True
+    else:
+        # 计算FFT对应的频率轴（获取每个FFT点对应的实际频率）
+        freqs = rfftfreq(N_FFT, d=1.0 / SAMPLE_RATE)
+        # 筛选出在目标频率范围内的索引（±100Hz容错，避免频率偏移）
+        valid_idx = np.where((freqs >= F_MIN - 100) & (freqs <= F_MAX + 100))[0]
+
+        # 检查是否有有效的频率索引
+        if len(valid_idx) == 0:
+            print("❌ 频率范围错误")
+            return
+
+        # 获取有效频率范围的起止索引
+        f_min_idx, f_max_idx = valid_idx[0], valid_idx[-1]
+
+        # 灰度查找表：预先将有效范围内每个FFT频点映射为0-1的灰度值（限幅确保在0-1范围内），
+        # 避免对每个像素重复做减法、除法和限幅
+        gray_lut = np.clip(
+            (freqs[f_min_idx:f_max_idx + 1] - F_MIN) / (F_MAX - F_MIN), 0.0, 1.0
+        ).astype(np.float32)
+
+        # 在目标频率范围内找到每个像素幅值最大的频率（即编码时的原始频率），
+        # 索引相对于有效范围的起点；各块由线程池并行处理
+        def detect(chunk):
+            return _fft_peaks(chunk, window, N_FFT, f_min_idx, f_max_idx)
+
+        parallel = True
+
+    # 逐块检测全部像素，每完成一块处理一次pygame窗口事件（而不是每个像素一次），
+    # 避免解码大图期间窗口无响应
+    peak_idx = np.empty(num_pixels, dtype=np.int64)
+    for start, chunk_peaks in _detect_in_chunks(detect, frames, parallel):
         # 处理pygame窗口事件（如关闭窗口）
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
-        # 计算当前像素对应的音频段的起止位置
-        start = i * SAMPLES_PER_PIXEL
-        end = start + SAMPLES_PER_PIXEL
-        frame = audio[start:end]  # 提取当前像素的音频段
-
-        # 应用汉宁窗（减少FFT的频谱泄漏，提高频率检测精度）
-        window = np.hanning(len(frame))
-        frame_win = frame * window
-
-        # 补零到N_FFT长度（提高FFT的频率分辨率）
-        padded = np.zeros(N_FFT)
-        padded[:len(frame_win)] = frame_win
-
-        # 对加窗后的音频段进行快速傅里叶变换（时域转频域）
-        fft_result = np.fft.rfft(padded)
-        # 计算频域信号的幅值（反映各频率的能量）
-        magnitude = np.abs(fft_result)
-
-        # 提取目标频率范围内的幅值
-        sub_mag = magnitude[f_min_idx:f_max_idx + 1]
-        # 找到幅值最大的频率索引（能量最强的频率，即编码时的原始频率）
-        peak_idx = f_min_idx + np.argmax(sub_mag)
-        # 获取该索引对应的实际频率
-        estimated_freq = freqs[peak_idx]
-
-        # 将检测到的频率映射回0-1的灰度值
-        gray = (estimated_freq - F_MIN) / (F_MAX - F_MIN)
-        # 限幅确保灰度值在0-1范围内
-        gray = np.clip(gray, 0.0, 1.0)
-
-        # 保存还原后的像素值
-        recovered_pixels[i] = gray
-
-        # 获取当前像素的坐标并在pygame表面上绘制
-        x, y = coords[i]
-        val = int(gray * 255)  # 转换为0-255的整数灰度值
-        image_surface.set_at((x, y), (val, val, val))  # 设置像素颜色（灰度）
-
-        # 每处理1024个像素刷新一次显示（平衡性能和流畅度）
-        if i % 1024 == 0:
-            # 计算缩放比例（保证图像完整显示在窗口中）
-            scale_ratio = min(SCREEN_W / width, SCREEN_H / height)
-            new_w = int(width * scale_ratio)
-            new_h = int(height * scale_ratio)
-
-            # 平滑缩放图像到窗口大小
-            scaled_surface = pygame.transform.smoothscale(
-                image_surface, (new_w, new_h)
-            )
-
-            # 计算图像在窗口中的居中偏移量
-            offset_x = (SCREEN_W - new_w) // 2
-            offset_y = (SCREEN_H - new_h) // 2
-
-            # 清屏（黑色背景）
-            screen.fill((0, 0, 0))
-            # 在窗口中绘制缩放后的图像
-            screen.blit(scaled_surface, (offset_x, offset_y))
-            # 更新显示
-            pygame.display.flip()
-
-    # 最终刷新显示（完整还原后的图像）
+        peak_idx[start:start + chunk_peaks.size] = chunk_peaks
+
+    # 通过查找表将检测到的频率映射回0-1的灰度值
+    recovered_pixels = gray_lut[peak_idx]
+
+    # 按列优先顺序还原为 [宽, 高] 的灰度数组，正好对应pygame表面数组的 [x, y] 坐标轴
+    columns = (recovered_pixels.reshape(width, height) * 255).astype(np.uint8)
+    # 以广播视图扩展为RGB三通道（灰度像素的三个通道取值相同，无需复制数据）
+    rgb = np.broadcast_to(columns[:, :, None], (width, height, 3))
+
+    # 创建一个和原始图像大小一致的pygame表面，并一次性写入全部还原的像素
+    image_surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(image_surface, rgb)
+
+    # 计算缩放比例（保证图像完整显示在窗口中）
     scale_ratio = min(SCREEN_W / width, SCREEN_H / height)
     new_w = int(width * scale_ratio)
     new_h = int(height * scale_ratio)
 
+    # 平滑缩放图像到窗口大小（只需缩放一次，逐列显现时直接截取已缩放的图像）
     scaled_surface = pygame.transform.smoothscale(
         image_surface, (new_w, new_h)
     )
 
+    # 计算图像在窗口中的居中偏移量
     offset_x = (SCREEN_W - new_w) // 2
     offset_y = (SCREEN_H - new_h) // 2
 
+    # 清屏（黑色背景）
     screen.fill((0, 0, 0))
-    screen.blit(scaled_surface, (offset_x, offset_y))
-    pygame.display.flip()
 
-    # 按列优先模式重建图像数组（转置还原为原始的行优先格式）
-    img_array = recovered_pixels.reshape((width, height)).T
+    # 每次刷新显现的原图列数（约每1024个像素刷新一次显示，平衡性能和流畅度）
+    cols_per_step = max(1, 1024 // height)
+
+    # 逐批显现还原的图像（由左至右逐列显现）
+    shown_w = 0  # 窗口中已显现的缩放后图像宽度
+    for x in range(cols_per_step, width + cols_per_step, cols_per_step):
+        # 处理pygame窗口事件（如关闭窗口）
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+        # 将原图中已显现到的列换算为缩放后图像中的列
+        next_w = min(x, width) * new_w // width
+
+        # 只绘制这一批新显现的区域
+        screen.blit(
+            scaled_surface,
+            (offset_x + shown_w, offset_y),
+            (shown_w, 0, next_w - shown_w, new_h)
+        )
+        shown_w = next_w
+
+        # 更新显示
+        pygame.display.flip()
 
-    # 转换为0-255的uint8格式并保存图像
-    img_uint8 = (img_array * 255).astype(np.uint8)
+    # 复用显示时得到的 [宽, 高] uint8灰度数组，转置还原为原始的行优先格式并保存图像
+    # （先转换为uint8再转置，复制的数据量只有float32的1/4）
+    img_uint8 = np.ascontiguousarray(columns.T)
     Image.fromarray(img_uint8, mode='L').save(output_image_path)
 
     print(f"✅ 解码完成并保存: {output_image_path}")